@@ -0,0 +1,52 @@
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+from ..models.schemas import Task
+from .taskmaster_client import TaskmasterClient
+
+__all__ = ["TaskLoader"]
+
+class TaskLoader:
+    """
+    Coalesces task-by-id lookups that arrive within `delay` seconds of each other (e.g. parallel
+    get_task_summary calls in one agent turn) into a single get_tasks_by_ids scan per time window.
+    """
+
+    def __init__(self, client: TaskmasterClient, delay: float = 0.002):
+        self._client = client
+        self._delay = delay
+        self._pending: Dict[Optional[int], List[Tuple[int, asyncio.Future]]] = {}
+        # Strong references so scheduled flushes aren't garbage-collected mid-flight
+        self._flushing: Set[asyncio.Task] = set()
+
+    async def load(self, task_id: int, time_window_days: Optional[int] = None) -> Optional[Task]:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        batch = self._pending.get(time_window_days)
+        if batch is None:
+            batch = self._pending[time_window_days] = []
+            loop.call_later(self._delay, self._schedule_flush, time_window_days)
+        batch.append((task_id, fut))
+        return await fut
+
+    def _schedule_flush(self, time_window_days: Optional[int]):
+        task = asyncio.ensure_future(self._flush(time_window_days))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _flush(self, time_window_days: Optional[int]):
+        batch = self._pending.pop(time_window_days, [])
+        found = None
+        try:
+            found = await self._client.get_tasks_by_ids([task_id for task_id, _ in batch], time_window_days=time_window_days)
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+        finally:
+            # Resolve every waiter, including when the flush itself is cancelled, so no load() is left hanging
+            for task_id, fut in batch:
+                if not fut.done():
+                    if found is None:
+                        fut.cancel()
+                    else:
+                        fut.set_result(found.get(task_id))
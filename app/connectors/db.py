@@ -1,17 +1,62 @@
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey, Table, UniqueConstraint
-from sqlalchemy.orm import sessionmaker, relationship, declarative_base
+from contextlib import asynccontextmanager
+from typing import Tuple
+from uuid import uuid4
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, UniqueConstraint
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
 import structlog
 from ..config import settings
 
 logger = structlog.get_logger()
 
+__all__ = ["engine", "SessionLocal", "Base", "User", "Category", "user_category_subscriptions", "init_db", "session_scope", "get_db", "dialect_insert"]
+
 DATABASE_URL = settings.DATABASE_URL
 
-if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Async driver for URLs that don't name one; an explicit driver is left as given
+_ASYNC_DRIVERS = {"postgres": "postgresql+asyncpg", "postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+def _async_url(raw_url: str) -> Tuple[URL, dict]:
+    """Parse DATABASE_URL into an async-driver URL plus the connect_args that driver needs."""
+    url = make_url(raw_url)
+    url = url.set(drivername=_ASYNC_DRIVERS.get(url.drivername, url.drivername))
+    connect_args = {}
+    if url.drivername == "postgresql+asyncpg" and "sslmode" in url.query:
+        # libpq's sslmode (e.g. ?sslmode=require in Supabase / Neon URLs) is asyncpg's `ssl` argument
+        connect_args["ssl"] = url.query["sslmode"]
+        url = url.difference_update_query(["sslmode"])
+    return url, connect_args
+
+_url, _connect_args = _async_url(DATABASE_URL)
+
+if _url.get_backend_name() == "sqlite":
+    engine = create_async_engine(_url, connect_args=_connect_args)
+elif settings.DB_POOL_CLASS == "null":
+    # PgBouncer (transaction pooling) owns the pooling; it also can't track asyncpg's prepared statements,
+    # so disable the statement cache and give each statement a unique name that can't collide across server connections
+    engine = create_async_engine(
+        _url,
+        poolclass=NullPool,
+        connect_args={
+            **_connect_args,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    )
 else:
-    engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine = create_async_engine(
+        _url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_timeout=30,
+        connect_args=_connect_args
+    )
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False, class_=AsyncSession)
 Base = declarative_base()
 
 # Mapping table as requested in prompt: user_category_subscriptions
@@ -30,23 +75,41 @@ class User(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     name = Column(String, nullable=True)
 
-def init_db():
+class Category(Base):
+    """Local mirror of Taskmaster categories, refreshed by the category sync job so subscriptions can be joined in SQL."""
+    __tablename__ = "categories"
+    id = Column(Integer, primary_key=True)  # Taskmaster category_id
+    name = Column(String, nullable=False)
+
+def dialect_insert(db: AsyncSession):
+    """The backend's own `insert`, which adds ON CONFLICT support (Postgres in production, SQLite locally)."""
+    if db.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+async def init_db():
     try:
         # Check if we are using a real URL or a placeholder
         if "@db" in settings.DATABASE_URL:
             logger.error("Database connection failed: 'db' is a placeholder. Please set a valid DATABASE_URL in Render.")
             return
             
-        Base.metadata.create_all(bind=engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
         logger.info("Database schemas synchronized successfully")
     except Exception as e:
         logger.error("Critical: Could not initialize database", error=str(e), url=settings.DATABASE_URL.split('@')[-1] if '@' in settings.DATABASE_URL else "N/A")
         # In some cloud environments, we might want to continue even if DB fails 
         # so that non-DB tools can still function.
 
-def get_db():
-    db = SessionLocal()
-    try:
+@asynccontextmanager
+async def session_scope():
+    """Pooled session for code outside FastAPI's dependency injection, e.g. the MCP tool handlers."""
+    async with SessionLocal() as db:
+        yield db
+
+async def get_db():
+    async with session_scope() as db:
         yield db
-    finally:
-        db.close()
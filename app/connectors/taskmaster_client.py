@@ -1,220 +1,495 @@
 import httpx
 import os
 import datetime
+import re
 import structlog
 import asyncio
-from typing import List, Dict, Optional
-from ..models.schemas import Task, CategoryBrief
+import orjson
+from cachetools import TTLCache
+from pydantic import BaseModel, TypeAdapter
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Optional, Union
+from ..models.schemas import Task, CategoryBrief, MatchedTask
 
 from ..config import settings
 
 logger = structlog.get_logger()
 
+__all__ = ["TaskmasterClient", "get_client", "is_blocked", "is_overdue"]
+
+_DATE_PREFIX_RE = re.compile(r"[^.Z]*")
+
+class _TaskPayload(BaseModel):
+    """GetCategoryTasks envelope: the task list arrives under "Data" (or "tasks")."""
+    Data: Optional[List[Task]] = None
+    tasks: Optional[List[Task]] = None
+
+# Parses a GetCategoryTasks body (bare list or envelope) straight from JSON bytes into Task models in one pydantic-core call
+_TASK_PAYLOAD_ADAPTER = TypeAdapter(Union[List[Task], _TaskPayload])
+
+def is_blocked(task: Task) -> bool:
+    """Blocked, on hold or stopped, by the task's status text."""
+    status = task.taskStatus.lower()
+    return "blocked" in status or "hold" in status or "stopped" in status
+
+def is_overdue(task: Task) -> bool:
+    """Past its due date by at least a day."""
+    return bool(task.daysOverdue and task.daysOverdue > 0)
+
+def _matches_query(query: str) -> Callable[[Task], bool]:
+    query = query.lower()
+    def predicate(t: Task) -> bool:
+        return query in t._subject_lc or query in t._assignee_lc or query in str(t.taskId)
+    return predicate
+
 class TaskmasterClient:
     def __init__(self, base_url: str = None, api_key: str = None):
         self.base_url = base_url or settings.TASKMASTER_API_URL
         self.api_key = api_key or settings.TASKMASTER_API_KEY
-        self._cache = {}
         self.cache_ttl = settings.CACHE_TTL
+        self._cache = TTLCache(maxsize=16, ttl=self.cache_ttl)
+        # Raw per-category task lists, and their per-time-window views, in separate caches so that views for
+        # several windows can't evict the raw lists (or each other) below one entry per category
+        self._task_cache = TTLCache(maxsize=settings.CACHE_MAXSIZE, ttl=self.cache_ttl)
+        self._view_cache = TTLCache(maxsize=settings.CACHE_MAXSIZE * 4, ttl=self.cache_ttl)
+        # Sidecar for follow-up comments keyed by (task_id, time_window_days): cached Tasks are never mutated,
+        # and comments change far less often than task metadata, so they outlive the task-list cache
+        self._comment_cache = TTLCache(maxsize=50_000, ttl=self.cache_ttl * 4)
+        # Short-lived record of failed fetches so an upstream outage isn't hammered by every request
+        self._neg_cache = TTLCache(maxsize=256, ttl=10)
+        # Repeated searches for the same alias (dashboard refreshes, follow-up prompts) skip the scan
+        self._search_cache = TTLCache(maxsize=256, ttl=60)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._category_id_set: Optional[frozenset] = None
+        # Caps follow-up history POSTs across all categories and callers, not just within one category
+        self._enrich_sem = asyncio.Semaphore(25)
 
     def _get_auth_header(self) -> dict:
         return {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use so connections are pooled and kept alive."""
+        if self._client is None or self._client.is_closed:
+            # Limits and HTTP/2 live on the transport, which also retries failed connection attempts
+            transport = httpx.AsyncHTTPTransport(
+                retries=2,
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=25, keepalive_expiry=30)
+            )
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                headers=self._get_auth_header()
+            )
+        return self._client
+
+    def clear_cache(self):
+        """Drop every cached category, task, comment and search result, e.g. after data changed upstream."""
+        self._cache.clear()
+        self._task_cache.clear()
+        self._view_cache.clear()
+        self._comment_cache.clear()
+        self._neg_cache.clear()
+        self._search_cache.clear()
+
+    async def aclose(self):
+        """Close the shared HTTP client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _singleflight(self, cache_key: str, fetch: Callable[[], Awaitable]):
+        """
+        Run `fetch` once per cache key; concurrent callers missing the same key await the in-flight result.
+        The fetch runs as its own task, so a cancelled caller (leader or not) never cancels it for the others.
+        """
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(fetch())
+            self._inflight[cache_key] = inflight
+            inflight.add_done_callback(lambda done: self._fetch_done(cache_key, done))
+        return await asyncio.shield(inflight)
+
+    def _fetch_done(self, cache_key: str, done: asyncio.Task):
+        self._inflight.pop(cache_key, None)
+        # Mark the exception as retrieved in case every caller was cancelled before it arrived
+        if not done.cancelled():
+            done.exception()
+
     async def get_all_categories(self) -> List[CategoryBrief]:
         """Fetch all categories from Taskmaster."""
         cache_key = "categories"
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
-            if (datetime.datetime.now() - timestamp).total_seconds() < self.cache_ttl:
-                return data
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if cache_key in self._neg_cache:
+            return []
+        return await self._singleflight(cache_key, lambda: self._fetch_categories(cache_key))
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/GetAllCategories",
-                    headers=self._get_auth_header(),
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                data = response.json()
-                raw_cats = []
-                if isinstance(data, list):
-                    raw_cats = data
-                elif isinstance(data, dict):
-                    raw_cats = data.get("Data", data.get("categories", []))
-                
-                categories = []
-                for cat in raw_cats:
-                    cat_id = cat.get("TaskCategoryId") or cat.get("CategoryId")
-                    cat_name = cat.get("TaskCategoryName") or cat.get("CategoryName")
-                    if cat_id and cat_name:
-                        categories.append(CategoryBrief(id=cat_id, name=cat_name))
-                
-                self._cache[cache_key] = (categories, datetime.datetime.now())
-                return categories
-            except Exception as e:
-                logger.error("Failed to fetch categories", error=str(e))
-                return []
+    async def get_categories_map(self) -> Dict[int, CategoryBrief]:
+        """Categories indexed by id, rebuilt only when the category list itself is refetched."""
+        categories = await self.get_all_categories()
+        cached = self._cache.get("categories_by_id")
+        if cached is None or cached[0] is not categories:
+            cached = (categories, {c.id: c for c in categories})
+            self._cache["categories_by_id"] = cached
+        return cached[1]
+
+    async def is_valid_category(self, category_id: int) -> bool:
+        """Check a category id against the (cached) Taskmaster category list."""
+        await self.get_all_categories()
+        return self._category_id_set is not None and category_id in self._category_id_set
+
+    async def _fetch_categories(self, cache_key: str) -> List[CategoryBrief]:
+        client = await self._get_client()
+        try:
+            response = await client.get(f"{self.base_url}/GetAllCategories")
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            raw_cats = []
+            if isinstance(data, list):
+                raw_cats = data
+            elif isinstance(data, dict):
+                raw_cats = data.get("Data", data.get("categories", []))
+            
+            categories = []
+            for cat in raw_cats:
+                cat_id = cat.get("TaskCategoryId") or cat.get("CategoryId")
+                cat_name = cat.get("TaskCategoryName") or cat.get("CategoryName")
+                if cat_id and cat_name:
+                    categories.append(CategoryBrief(id=cat_id, name=cat_name))
+            
+            self._cache[cache_key] = categories
+            self._category_id_set = frozenset(c.id for c in categories)
+            return categories
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error("Failed to fetch categories", error=str(e))
+            self._neg_cache[cache_key] = True
+            return []
 
     async def get_category_tasks(self, category_id: int, time_window_days: Optional[int] = 7) -> List[Task]:
         """Fetch tasks for a specific category with comments within a time window."""
         cache_key = f"tasks_{category_id}_{time_window_days}"
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
-            if (datetime.datetime.now() - timestamp).total_seconds() < self.cache_ttl:
-                return data
+        cached = self._view_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return await self._singleflight(cache_key, lambda: self._build_category_view(category_id, time_window_days, cache_key))
+
+    async def _build_category_view(self, category_id: int, time_window_days: Optional[int], cache_key: str) -> List[Task]:
+        """Pair the shared task list with the comments for one time window, leaving the shared Tasks untouched."""
+        tasks = await self._get_raw_category_tasks(category_id)
+        if tasks is None:
+            return []
+        comments = await self.get_comments_for_tasks([t.taskId for t in tasks], time_window_days)
+        view = [t.model_copy(update={"followUpComments": comments.get(t.taskId, [])}) for t in tasks]
+        self._view_cache[cache_key] = view
+        return view
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+    async def _get_raw_category_tasks(self, category_id: int) -> Optional[List[Task]]:
+        """Task metadata for a category, shared by every time window. None if the fetch failed."""
+        cache_key = f"tasks_{category_id}"
+        cached = self._task_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if cache_key in self._neg_cache:
+            return None
+        return await self._singleflight(cache_key, lambda: self._fetch_category_tasks(category_id, cache_key))
+
+    async def _fetch_category_tasks(self, category_id: int, cache_key: str) -> Optional[List[Task]]:
+        client = await self._get_client()
+        try:
+            response = await client.get(
+                f"{self.base_url}/GetCategoryTasks",
+                params={"CategoryId": category_id},
+                timeout=60.0
+            )
+            response.raise_for_status()
+            payload = _TASK_PAYLOAD_ADAPTER.validate_json(response.content)
+            tasks = payload if isinstance(payload, list) else (payload.Data or payload.tasks or [])
+            self._task_cache[cache_key] = tasks
+            return tasks
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error("Failed to fetch tasks", category_id=category_id, error=str(e))
+            self._neg_cache[cache_key] = True
+            return None
+
+    async def get_comments(self, task_id: int, time_window_days: Optional[int] = 7) -> List[str]:
+        """Follow-up comments for a single task within a time window, served from the comment cache when possible."""
+        comments = await self.get_comments_for_tasks([task_id], time_window_days)
+        return comments.get(task_id, [])
+
+    async def get_comments_for_tasks(self, task_ids: List[int], time_window_days: Optional[int] = 7) -> Dict[int, List[str]]:
+        """Follow-up comments for many tasks, in one bulk call when configured, else with bounded per-task calls."""
+        comments: Dict[int, List[str]] = {}
+        missing = []
+        for task_id in task_ids:
+            cached = self._comment_cache.get((task_id, time_window_days))
+            if cached is not None:
+                comments[task_id] = cached
+            else:
+                missing.append(task_id)
+        if not missing:
+            return comments
+
+        client = await self._get_client()
+        # One wall-clock read per batch rather than one per task
+        threshold = None
+        if time_window_days is not None:
+            threshold = datetime.datetime.now() - datetime.timedelta(days=time_window_days)
+
+        if settings.TASKMASTER_BULK_FOLLOWUP_ENDPOINT:
             try:
-                response = await client.get(
-                    f"{self.base_url}/GetCategoryTasks",
-                    params={"CategoryId": category_id},
-                    headers=self._get_auth_header()
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                tasks_list = []
-                if isinstance(data, list):
-                    tasks_list = data
-                elif isinstance(data, dict):
-                    tasks_list = data.get("Data") or data.get("tasks") or []
-
-                tasks = [Task(**t) for t in tasks_list]
-                
-                # Fetch comments for each task to enable summarization
-                await asyncio.gather(*[self._enrich_task_comments(client, t, time_window_days) for t in tasks])
-                self._cache[cache_key] = (tasks, datetime.datetime.now())
-                return tasks
+                comments.update(await self._fetch_comments_bulk(client, missing, time_window_days, threshold))
+                return comments
             except Exception as e:
-                logger.error("Failed to fetch tasks", category_id=category_id, error=str(e))
-                return []
+                logger.warning("Bulk comment fetch failed, falling back to per-task calls", error=str(e))
+
+        async def fetch(task_id):
+            result = await self._fetch_comments(client, task_id, time_window_days, threshold)
+            if result is not None:
+                comments[task_id] = result
+
+        await asyncio.gather(*[fetch(task_id) for task_id in missing])
+        return comments
 
     async def get_task_by_id(self, task_id: int, time_window_days: Optional[int] = None) -> Optional[Task]:
         """Fetch a specific task by ID and enrich its comments."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Taskmaster doesn't have a direct GetTaskById, so we might have to search or use a generic endpoint if available.
-            # Usually, GetTaskFollowUpHistory works if we have the ID.
-            # For simplicity, let's assume we can fetch its comments directly and we might need to find its metadata elsewhere.
-            # However, most ScribeEMR APIs return a task object in Search results.
-            # Let's search for the ID specifically.
-            search_results = await self.search_tasks(str(task_id), time_window_days=time_window_days)
-            for item in search_results:
-                task = Task(**item["task"])
-                if task.taskId == task_id:
-                    return task
-            return None
+        # Taskmaster doesn't have a direct GetTaskById, so we might have to search or use a generic endpoint if available.
+        # Usually, GetTaskFollowUpHistory works if we have the ID.
+        # For simplicity, let's assume we can fetch its comments directly and we might need to find its metadata elsewhere.
+        # However, most ScribeEMR APIs return a task object in Search results.
+        # Let's search for the ID specifically.
+        search_results = await self.search_tasks(str(task_id), time_window_days=time_window_days)
+        for item in search_results:
+            if item.task.taskId == task_id:
+                return item.task
+        return None
+
+    async def get_tasks_by_ids(self, task_ids: List[int], time_window_days: Optional[int] = None) -> Dict[int, Task]:
+        """Fetch several tasks by ID with one pass over all categories; IDs that aren't found are left out."""
+        if not task_ids:
+            return {}
+        wanted = frozenset(task_ids)
+        buckets = await self.scan_all_tasks({"wanted": lambda t: t.taskId in wanted}, time_window_days=time_window_days)
+        found: Dict[int, Task] = {}
+        for item in buckets["wanted"]:
+            found.setdefault(item.task.taskId, item.task)
+        return found
+
+    async def _map_categories(self, fn: Callable[[CategoryBrief], Awaitable[List]], concurrency: int = 8) -> List:
+        """Run `fn` for every category through a fixed pool of workers and flatten the results in category order."""
+        categories = await self.get_all_categories()
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(categories):
+            queue.put_nowait(item)
+        results: List[List] = [[] for _ in categories]
+
+        async def worker():
+            while True:
+                try:
+                    idx, cat = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[idx] = await fn(cat)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(categories)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for w in workers:
+                w.cancel()
+            raise
+        return [item for sublist in results for item in sublist]
+
+    async def scan_all_tasks(self, predicates: Dict[str, Callable[[Task], bool]], time_window_days: Optional[int] = 7) -> Dict[str, List[MatchedTask]]:
+        """Fetch every category once and bucket each task under every predicate it satisfies."""
+        async def scan(cat):
+            tasks = await self.get_category_tasks(cat.id, time_window_days=time_window_days)
+            hits = []
+            for t in tasks:
+                matched = None
+                for name, predicate in predicates.items():
+                    if predicate(t):
+                        if matched is None:
+                            matched = MatchedTask(category=cat.name, task=t)
+                        hits.append((name, matched))
+            return hits
 
-    async def search_tasks(self, query: str, time_window_days: Optional[int] = 7) -> List[Dict]:
+        buckets: Dict[str, List[MatchedTask]] = {name: [] for name in predicates}
+        for name, item in await self._map_categories(scan):
+            buckets[name].append(item)
+        return buckets
+
+    async def search_tasks(self, query: str, time_window_days: Optional[int] = 7) -> List[MatchedTask]:
         """Search for tasks matching a query across all categories."""
+        cache_key = (query.lower(), time_window_days)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        buckets = await self.scan_all_tasks({"matches": _matches_query(query)}, time_window_days=time_window_days)
+        # Empty results may just mean an upstream failure, which the short-lived negative cache already covers
+        if buckets["matches"]:
+            self._search_cache[cache_key] = buckets["matches"]
+        return buckets["matches"]
+
+    async def iter_search_tasks(self, query: str, time_window_days: Optional[int] = 7, concurrency: int = 8) -> AsyncIterator[List[MatchedTask]]:
+        """Yield each category's matches as soon as that category is scanned, rather than after the whole search."""
+        cached = self._search_cache.get((query.lower(), time_window_days))
+        if cached is not None:
+            yield cached
+            return
+
+        predicate = _matches_query(query)
         categories = await self.get_all_categories()
-        query = query.lower()
-        
-        semaphore = asyncio.Semaphore(5)
-        
-        async def fetch_and_filter(cat):
-            async with semaphore:
-                tasks = await self.get_category_tasks(cat.id, time_window_days=time_window_days)
-                matches = []
-                for t in tasks:
-                    if query in str(t.taskId) or query in t.taskSubject.lower() or (t.assigneeName and query in t.assigneeName.lower()):
-                        matches.append({
-                            "category": cat.name,
-                            "task": t.model_dump(by_alias=True)
-                        })
-                return matches
-
-        results = await asyncio.gather(*[fetch_and_filter(cat) for cat in categories])
-        # Flatten the list
-        flat_results = [item for sublist in results for item in sublist]
-        return flat_results
-
-    async def get_all_blocked_tasks(self) -> List[Dict]:
+        queue: asyncio.Queue = asyncio.Queue()
+        for cat in categories:
+            queue.put_nowait(cat)
+        # One entry per category (its hits, or the exception that stopped its scan), in completion order
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            while True:
+                try:
+                    cat = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    tasks = await self.get_category_tasks(cat.id, time_window_days=time_window_days)
+                    results.put_nowait([MatchedTask(category=cat.name, task=t) for t in tasks if predicate(t)])
+                except Exception as e:
+                    results.put_nowait(e)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(categories)))]
+        try:
+            for _ in categories:
+                hits = await results.get()
+                if isinstance(hits, Exception):
+                    raise hits
+                if hits:
+                    yield hits
+        finally:
+            # The consumer may stop early (e.g. client disconnect); shared fetches carry on for other callers
+            for w in workers:
+                w.cancel()
+
+    async def _get_overview(self, time_window_days: Optional[int] = 7) -> Dict[str, List[MatchedTask]]:
+        """Blocked and overdue buckets from one scan, shared by every caller asking within the search-cache TTL."""
+        cache_key = f"overview_{time_window_days}"
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async def fetch():
+            buckets = await self.scan_all_tasks({"blocked": is_blocked, "overdue": is_overdue}, time_window_days=time_window_days)
+            # As with searches, an empty scan may be an upstream failure; leave that to the negative cache
+            if buckets["blocked"] or buckets["overdue"]:
+                self._search_cache[cache_key] = buckets
+            return buckets
+
+        return await self._singleflight(cache_key, fetch)
+
+    async def get_overview_bundle(self, category_id: Optional[int] = None, time_window_days: Optional[int] = 7) -> Dict[str, List[MatchedTask]]:
+        """Blocked, overdue and (optionally) one category's tasks, all served from the same scan."""
+        bundle = dict(await self._get_overview(time_window_days))
+        if category_id is not None:
+            category = (await self.get_categories_map()).get(category_id)
+            if category is None:
+                # Not a known category: nothing the scan covered, and not worth an upstream fetch
+                bundle["category"] = []
+            else:
+                # The scan has just cached this category, so neither call goes back upstream
+                tasks = await self.get_category_tasks(category_id, time_window_days=time_window_days)
+                bundle["category"] = [MatchedTask(category=category.name, task=t) for t in tasks]
+        return bundle
+
+    async def get_all_blocked_tasks(self) -> List[MatchedTask]:
         """Fetch all tasks that are currently blocked across all categories."""
-        categories = await self.get_all_categories()
-        
-        semaphore = asyncio.Semaphore(5)
-        
-        async def fetch_blocked(cat):
-            async with semaphore:
-                tasks = await self.get_category_tasks(cat.id, time_window_days=7) # Blocked tasks usually care about recent updates
-                blocks = []
-                for t in tasks:
-                    status = t.taskStatus.lower()
-                    if "blocked" in status or "hold" in status or "stopped" in status:
-                        blocks.append({
-                            "category": cat.name,
-                            "task": t.model_dump(by_alias=True)
-                        })
-                return blocks
-
-        results = await asyncio.gather(*[fetch_blocked(cat) for cat in categories])
-        return [item for sublist in results for item in sublist]
+        # Blocked tasks usually care about recent updates
+        return (await self._get_overview(time_window_days=7))["blocked"]
 
-    async def get_all_overdue_tasks(self) -> List[Dict]:
+    async def get_all_overdue_tasks(self) -> List[MatchedTask]:
         """Fetch all tasks that are currently overdue across all categories."""
-        categories = await self.get_all_categories()
-        
-        semaphore = asyncio.Semaphore(5)
-        
-        async def fetch_overdue(cat):
-            async with semaphore:
-                tasks = await self.get_category_tasks(cat.id, time_window_days=7)
-                overdue = []
-                for t in tasks:
-                    if t.daysOverdue and t.daysOverdue > 0:
-                        overdue.append({
-                            "category": cat.name,
-                            "task": t.model_dump(by_alias=True)
-                        })
-                return overdue
-
-        results = await asyncio.gather(*[fetch_overdue(cat) for cat in categories])
-        return [item for sublist in results for item in sublist]
+        return (await self._get_overview(time_window_days=7))["overdue"]
 
-    async def _enrich_task_comments(self, client: httpx.AsyncClient, task: Task, time_window_days: Optional[int] = 7):
+    async def get_dashboard(self, query: Optional[str] = None, time_window_days: Optional[int] = 7) -> Dict[str, List[MatchedTask]]:
+        """Blocked, overdue and (optionally) query-matching tasks from a single pass over all categories."""
+        predicates = {"blocked": is_blocked, "overdue": is_overdue}
+        if query:
+            predicates["matches"] = _matches_query(query)
+        return await self.scan_all_tasks(predicates, time_window_days=time_window_days)
+
+    async def _fetch_comments(self, client: httpx.AsyncClient, task_id: int, time_window_days: Optional[int],
+                              threshold: Optional[datetime.datetime]) -> Optional[List[str]]:
         """Fetch comments for a task within a specified time window. If time_window_days is None, fetch all."""
         try:
-            response = await client.post(
-                f"{self.base_url}/GetTaskFollowUpHistory",
-                json={"TaskId": task.taskId, "PageSize": 50 if time_window_days is None else 20},
-                headers={"Content-Type": "application/json", **self._get_auth_header()},
-                timeout=10.0
-            )
+            async with self._enrich_sem:
+                response = await client.post(
+                    f"{self.base_url}/GetTaskFollowUpHistory",
+                    json={"TaskId": task_id, "PageSize": 50 if time_window_days is None else 20},
+                    timeout=10.0
+                )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 history = []
                 if isinstance(data, dict):
                     inner = data.get("Data", {})
                     history = (inner.get("FollowUpHistoryDetails", []) if isinstance(inner, dict) 
                                else (data.get("FollowUpHistoryDetails", []) if isinstance(data.get("FollowUpHistoryDetails"), list) else []))
-                
-                comments = []
-                threshold = None
-                if time_window_days is not None:
-                    threshold = datetime.datetime.now() - datetime.timedelta(days=time_window_days)
-                
-                for item in history:
-                    try:
-                        text = item.get("TaskFollowUpComments") or item.get("FollowUpComment")
-                        if not text:
-                            continue
-                            
-                        if threshold:
-                            date_str = (item.get("FollowUpDate") or "").replace("Z", "")
-                            if "." in date_str:
-                                date_str = date_str.split(".")[0]
-                            f_date = datetime.datetime.fromisoformat(date_str)
-                            if f_date >= threshold:
-                                comments.append(text)
-                        else:
-                            # No threshold, add all
-                            comments.append(text)
-                    except:
-                        if not threshold: # If no date required, just add it
-                            text = item.get("TaskFollowUpComments") or item.get("FollowUpComment")
-                            if text: comments.append(text)
-                        continue
-                task.followUpComments = comments
+                comments = self._filter_comments(history, threshold)
+                self._comment_cache[(task_id, time_window_days)] = comments
+                return comments
         except Exception as e:
-            logger.warning("Failed to enrich task comments", task_id=task.taskId, error=str(e))
+            logger.warning("Failed to enrich task comments", task_id=task_id, error=str(e))
+        return None
+
+    async def _fetch_comments_bulk(self, client: httpx.AsyncClient, task_ids: List[int], time_window_days: Optional[int],
+                                   threshold: Optional[datetime.datetime]) -> Dict[int, List[str]]:
+        """Fetch comments for many tasks in one request against the bulk follow-up endpoint."""
+        response = await client.post(
+            f"{self.base_url}/{settings.TASKMASTER_BULK_FOLLOWUP_ENDPOINT}",
+            json={"TaskIds": task_ids, "PageSize": 50 if time_window_days is None else 20},
+            timeout=60.0
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        entries = (data.get("Data") or []) if isinstance(data, dict) else data
+        history_by_task = {
+            entry.get("TaskId"): entry.get("FollowUpHistoryDetails") or []
+            for entry in entries if isinstance(entry, dict)
+        }
+        comments = {}
+        for task_id in task_ids:
+            comments[task_id] = self._filter_comments(history_by_task.get(task_id, []), threshold)
+            self._comment_cache[(task_id, time_window_days)] = comments[task_id]
+        return comments
+
+    def _filter_comments(self, history: List[Dict], threshold: Optional[datetime.datetime]) -> List[str]:
+        """Extract comment texts from follow-up history, keeping only those dated at or after `threshold`."""
+        comments = []
+        for item in history:
+            try:
+                text = item.get("TaskFollowUpComments") or item.get("FollowUpComment")
+                if not text:
+                    continue
+                    
+                if threshold:
+                    # Drop fractional seconds and the UTC designator in a single regex match
+                    date_str = _DATE_PREFIX_RE.match(item.get("FollowUpDate") or "").group()
+                    if datetime.datetime.fromisoformat(date_str) >= threshold:
+                        comments.append(text)
+                else:
+                    # No threshold, add all
+                    comments.append(text)
+            except (AttributeError, TypeError, ValueError):
+                continue
+        return comments
+
+_shared: Optional[TaskmasterClient] = None
+
+def get_client() -> TaskmasterClient:
+    """The process-wide client, so every tool shares one connection pool and one set of caches."""
+    global _shared
+    if _shared is None:
+        _shared = TaskmasterClient()
+    return _shared
@@ -2,14 +2,19 @@ import structlog
 # Deployment Version: 1.0.1 - Robust SSE Hub
 import sys
 import asyncio
+import orjson
+from typing import Any, Awaitable, Callable, Dict, List
 from fastapi import FastAPI, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from contextlib import asynccontextmanager
 
 from .config import settings
-from .connectors.taskmaster_client import TaskmasterClient
-from .connectors.db import get_db, init_db
+from .connectors.taskmaster_client import get_client
+from .connectors.db import get_db, session_scope
+from .migrate import run_migrations
+from .services.executor import start_cpu_pool, shutdown_cpu_pool
 from .tools import categories, tasks, subscriptions, newsletter
+from .models.schemas import CategoryBrief, MatchedTask, Task
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
@@ -27,7 +32,7 @@ structlog.configure(
 logger = structlog.get_logger()
 
 # Initialize Taskmaster Client
-taskmaster_client = TaskmasterClient()
+taskmaster_client = get_client()
 
 # Initialize MCP Server
 mcp_server = Server("taskmaster-mcp")
@@ -35,232 +40,302 @@ mcp_server = Server("taskmaster-mcp")
 # Initialize SSE Transport for Cloud/Remote MCP
 sse = SseServerTransport("/messages")
 
+# Tool definitions are static, so they are built once at import rather than on every list request
+_TOOL_LIST: tuple[types.Tool, ...] = (
+    types.Tool(
+        name="get_categories",
+        description="Get all active categories from Taskmaster",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        }
+    ),
+    types.Tool(
+        name="search_tasks",
+        description="Search for tasks by alias, provider name, keyword or Task ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string"},
+                "time_window_days": {"type": "integer", "description": "Number of days to look back for updates. Default 7. Use 0 or null for all time."}
+            },
+            "required": ["query"]
+        }
+    ),
+    types.Tool(
+        name="get_provider_updates",
+        description="Get a summarized report for a specific medical provider alias; detail_level \"brief\" returns just counts and titles",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "provider_alias": {"type": "string"},
+                "detail_level": {"type": "string", "enum": ["brief", "short", "detailed"], "default": "short"},
+                "time_window_days": {"type": "integer", "default": 7}
+            },
+            "required": ["provider_alias"]
+        }
+    ),
+    types.Tool(
+        name="get_task_summary",
+        description="Fetch and summarize a specific task by its ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "integer"},
+                "detail_level": {"type": "string", "enum": ["short", "detailed"], "default": "short"},
+                "time_window_days": {"type": "integer", "description": "Number of days to look back for updates. Null for all time."}
+            },
+            "required": ["task_id"]
+        }
+    ),
+    types.Tool(
+        name="get_task_summaries",
+        description="Fetch and summarize several tasks by ID in one call; prefer this over repeated get_task_summary calls",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_ids": {"type": "array", "items": {"type": "integer"}},
+                "detail_level": {"type": "string", "enum": ["short", "detailed"], "default": "short"},
+                "time_window_days": {"type": "integer", "description": "Number of days to look back for updates. Null for all time."}
+            },
+            "required": ["task_ids"]
+        }
+    ),
+    types.Tool(
+        name="get_blocked_tasks",
+        description="Fetch all blocked tasks across all categories",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    types.Tool(
+        name="get_overdue_tasks",
+        description="Fetch all overdue tasks across all categories",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    types.Tool(
+        name="get_executive_overview",
+        description="Fetch blocked and overdue tasks across all categories in one call, optionally with one category's tasks; prefer this when more than one is needed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category_id": {"type": "integer", "description": "Also include this category's tasks"}
+            }
+        }
+    ),
+    types.Tool(
+        name="get_weekly_summary",
+        description="Generate category-level summary",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category_id": {"type": "integer"}
+            },
+            "required": ["category_id"]
+        }
+    ),
+    types.Tool(
+        name="get_category_tasks",
+        description="Fetch tasks for a specific category",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category_id": {"type": "integer"}
+            },
+            "required": ["category_id"]
+        }
+    ),
+    types.Tool(
+        name="list_user_subscriptions",
+        description="Fetch categories subscribed by a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_email": {"type": "string"}
+            },
+            "required": ["user_email"]
+        }
+    ),
+    types.Tool(
+        name="subscribe_category",
+        description="Subscribe user to a category",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_email": {"type": "string"},
+                "category_id": {"type": "integer"}
+            },
+            "required": ["user_email", "category_id"]
+        }
+    ),
+    types.Tool(
+        name="unsubscribe_category",
+        description="Unsubscribe user from a category",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_email": {"type": "string"},
+                "category_id": {"type": "integer"}
+            },
+            "required": ["user_email", "category_id"]
+        }
+    ),
+    types.Tool(
+        name="preview_newsletter",
+        description="Preview user's weekly newsletter",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_email": {"type": "string"}
+            },
+            "required": ["user_email"]
+        }
+    )
+)
+
+# Pre-encoded once for the REST mirror of the tool list; the MCP transport does its own encoding
+_TOOL_LIST_BYTES = orjson.dumps([tool.model_dump(mode="json", exclude_none=True) for tool in _TOOL_LIST])
+
 @mcp_server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
-    return [
-        types.Tool(
-            name="get_categories",
-            description="Get all active categories from Taskmaster",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            }
-        ),
-        types.Tool(
-            name="search_tasks",
-            description="Search for tasks by alias, provider name, keyword or Task ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string"},
-                    "time_window_days": {"type": "integer", "description": "Number of days to look back for updates. Default 7. Use 0 or null for all time."}
-                },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="get_provider_updates",
-            description="Get a summarized report for a specific medical provider alias",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "provider_alias": {"type": "string"},
-                    "detail_level": {"type": "string", "enum": ["short", "detailed"], "default": "short"},
-                    "time_window_days": {"type": "integer", "default": 7}
-                },
-                "required": ["provider_alias"]
-            }
-        ),
-        types.Tool(
-            name="get_task_summary",
-            description="Fetch and summarize a specific task by its ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "integer"},
-                    "detail_level": {"type": "string", "enum": ["short", "detailed"], "default": "short"},
-                    "time_window_days": {"type": "integer", "description": "Number of days to look back for updates. Null for all time."}
-                },
-                "required": ["task_id"]
-            }
-        ),
-        types.Tool(
-            name="get_blocked_tasks",
-            description="Fetch all blocked tasks across all categories",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        types.Tool(
-            name="get_overdue_tasks",
-            description="Fetch all overdue tasks across all categories",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        types.Tool(
-            name="get_weekly_summary",
-            description="Generate category-level summary",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category_id": {"type": "integer"}
-                },
-                "required": ["category_id"]
-            }
-        ),
-        types.Tool(
-            name="get_category_tasks",
-            description="Fetch tasks for a specific category",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category_id": {"type": "integer"}
-                },
-                "required": ["category_id"]
-            }
-        ),
-        types.Tool(
-            name="list_user_subscriptions",
-            description="Fetch categories subscribed by a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_email": {"type": "string"}
-                },
-                "required": ["user_email"]
-            }
-        ),
-        types.Tool(
-            name="subscribe_category",
-            description="Subscribe user to a category",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_email": {"type": "string"},
-                    "category_id": {"type": "integer"}
-                },
-                "required": ["user_email", "category_id"]
-            }
-        ),
-        types.Tool(
-            name="unsubscribe_category",
-            description="Unsubscribe user from a category",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_email": {"type": "string"},
-                    "category_id": {"type": "integer"}
-                },
-                "required": ["user_email", "category_id"]
-            }
-        ),
-        types.Tool(
-            name="preview_newsletter",
-            description="Preview user's weekly newsletter",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_email": {"type": "string"}
-                },
-                "required": ["user_email"]
-            }
-        )
-    ]
+    return list(_TOOL_LIST)
+
+# --- MCP tool handlers: one adapter per tool, dispatched through _TOOL_DISPATCH ---
+
+async def _h_get_categories(args: dict):
+    return await categories.get_categories(taskmaster_client)
+
+async def _h_search_tasks(args: dict):
+    query = args.get("query")
+    window = args.get("time_window_days", 7)
+    return await tasks.get_tasks_by_alias(query, taskmaster_client, time_window_days=window)
+
+async def _h_get_provider_updates(args: dict):
+    alias = args.get("provider_alias")
+    detail = args.get("detail_level", "short")
+    window = args.get("time_window_days", 7)
+    return await tasks.get_provider_updates(alias, taskmaster_client, detail_level=detail, time_window_days=window)
+
+async def _h_get_task_summary(args: dict):
+    tid = args.get("task_id")
+    detail = args.get("detail_level", "short")
+    window = args.get("time_window_days")
+    return await tasks.get_task_summary(tid, taskmaster_client, detail_level=detail, time_window_days=window)
+
+async def _h_get_task_summaries(args: dict):
+    tids = args.get("task_ids") or []
+    detail = args.get("detail_level", "short")
+    window = args.get("time_window_days")
+    return await tasks.get_task_summaries(tids, taskmaster_client, detail_level=detail, time_window_days=window)
+
+async def _h_get_blocked_tasks(args: dict):
+    return await tasks.get_all_blocked_tasks(taskmaster_client)
+
+async def _h_get_overdue_tasks(args: dict):
+    return await tasks.get_all_overdue_tasks(taskmaster_client)
+
+async def _h_get_executive_overview(args: dict):
+    return await tasks.get_executive_overview(taskmaster_client, args.get("category_id"))
+
+async def _h_get_weekly_summary(args: dict):
+    return await newsletter.get_weekly_summary(args.get("category_id"), taskmaster_client)
+
+async def _h_get_category_tasks(args: dict):
+    return await tasks.get_category_tasks(args.get("category_id"), taskmaster_client)
+
+async def _h_list_user_subscriptions(args: dict):
+    async with session_scope() as db:
+        return await subscriptions.list_user_subscriptions(args.get("user_email"), db)
+
+async def _h_subscribe_category(args: dict):
+    cat_id = args.get("category_id")
+    # Validate category_id
+    if not await taskmaster_client.is_valid_category(cat_id):
+        return "Error: Invalid Category ID"
+    async with session_scope() as db:
+        return await subscriptions.subscribe_category(args.get("user_email"), cat_id, db, taskmaster_client)
+
+async def _h_unsubscribe_category(args: dict):
+    async with session_scope() as db:
+        return await subscriptions.unsubscribe_category(args.get("user_email"), args.get("category_id"), db)
+
+async def _h_preview_newsletter(args: dict):
+    async with session_scope() as db:
+        return await newsletter.preview_newsletter(args.get("user_email"), taskmaster_client, db)
+
+_TOOL_DISPATCH: Dict[str, Callable[[dict], Awaitable[Any]]] = {
+    "get_categories": _h_get_categories,
+    "search_tasks": _h_search_tasks,
+    "get_provider_updates": _h_get_provider_updates,
+    "get_task_summary": _h_get_task_summary,
+    "get_task_summaries": _h_get_task_summaries,
+    "get_blocked_tasks": _h_get_blocked_tasks,
+    "get_overdue_tasks": _h_get_overdue_tasks,
+    "get_executive_overview": _h_get_executive_overview,
+    "get_weekly_summary": _h_get_weekly_summary,
+    "get_category_tasks": _h_get_category_tasks,
+    "list_user_subscriptions": _h_list_user_subscriptions,
+    "subscribe_category": _h_subscribe_category,
+    "unsubscribe_category": _h_unsubscribe_category,
+    "preview_newsletter": _h_preview_newsletter,
+}
+
+def _pyd_default(obj: Any):
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(by_alias=True)
+    return str(obj)
+
+def _to_text(obj: Any) -> str:
+    return orjson.dumps(obj, default=_pyd_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+def _wrap(res: Any) -> list[types.TextContent]:
+    """Text results (summaries, errors) pass through as-is; structured results are emitted as JSON."""
+    text = res if isinstance(res, str) else _to_text(res)
+    return [types.TextContent(type="text", text=text)]
 
 @mcp_server.call_tool()
 async def handle_call_tool(name: str, arguments: dict | None) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    if name == "get_categories":
-        res = await categories.get_categories(taskmaster_client)
-        return [types.TextContent(type="text", text=str(res))]
-    elif name == "search_tasks":
-        query = arguments.get("query")
-        window = arguments.get("time_window_days", 7)
-        res = await tasks.get_tasks_by_alias(query, taskmaster_client, time_window_days=window)
-        return [types.TextContent(type="text", text=str(res))]
-    elif name == "get_provider_updates":
-        alias = arguments.get("provider_alias")
-        detail = arguments.get("detail_level", "short")
-        window = arguments.get("time_window_days", 7)
-        res = await tasks.get_provider_updates(alias, taskmaster_client, detail_level=detail, time_window_days=window)
-        return [types.TextContent(type="text", text=str(res))]
-    elif name == "get_task_summary":
-        tid = arguments.get("task_id")
-        detail = arguments.get("detail_level", "short")
-        window = arguments.get("time_window_days")
-        res = await tasks.get_task_summary(tid, taskmaster_client, detail_level=detail, time_window_days=window)
-        return [types.TextContent(type="text", text=str(res))]
-    elif name == "get_blocked_tasks":
-        res = await tasks.get_all_blocked_tasks(taskmaster_client)
-        return [types.TextContent(type="text", text=str(res))]
-    elif name == "get_overdue_tasks":
-        res = await tasks.get_all_overdue_tasks(taskmaster_client)
-        return [types.TextContent(type="text", text=str(res))]
-    elif name == "get_weekly_summary":
-        cat_id = arguments.get("category_id")
-        res = await newsletter.get_weekly_summary(cat_id, taskmaster_client)
-        return [types.TextContent(type="text", text=str(res))]
-    elif name == "get_category_tasks":
-        cat_id = arguments.get("category_id")
-        res = await tasks.get_category_tasks(cat_id, taskmaster_client)
-        return [types.TextContent(type="text", text=str(res))]
-    elif name == "list_user_subscriptions":
-        email = arguments.get("user_email")
-        from .connectors.db import SessionLocal
-        db = SessionLocal()
-        try:
-            subs = await subscriptions.list_user_subscriptions(email, db)
-            all_cats = await taskmaster_client.get_all_categories()
-            result = []
-            for cat_id in subs:
-                cat_info = next((c for c in all_cats if c.id == cat_id), {"id": cat_id, "name": "Unknown"})
-                result.append(cat_info)
-            return [types.TextContent(type="text", text=str(result))]
-        finally:
-            db.close()
-    elif name == "subscribe_category":
-        email = arguments.get("user_email")
-        cat_id = arguments.get("category_id")
-        from .connectors.db import SessionLocal
-        db = SessionLocal()
-        try:
-            # Validate category_id
-            all_cats = await taskmaster_client.get_all_categories()
-            if not any(c.id == cat_id for c in all_cats):
-                return [types.TextContent(type="text", text="Error: Invalid Category ID")]
-            res = await subscriptions.subscribe_category(email, cat_id, db)
-            return [types.TextContent(type="text", text=str(res))]
-        finally:
-            db.close()
-    elif name == "unsubscribe_category":
-        email = arguments.get("user_email")
-        cat_id = arguments.get("category_id")
-        from .connectors.db import SessionLocal
-        db = SessionLocal()
-        try:
-            res = await subscriptions.unsubscribe_category(email, cat_id, db)
-            return [types.TextContent(type="text", text=str(res))]
-        finally:
-            db.close()
-    elif name == "preview_newsletter":
-        email = arguments.get("user_email")
-        from .connectors.db import SessionLocal
-        db = SessionLocal()
-        try:
-            res = await newsletter.preview_newsletter(email, taskmaster_client, db)
-            return [types.TextContent(type="text", text=str(res))]
-        finally:
-            db.close()
-    else:
+    handler = _TOOL_DISPATCH.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return _wrap(await handler(arguments or {}))
+
+async def _category_sync_loop():
+    """
+    Keep the local categories mirror fresh so subscription listings can be joined in SQL. Every worker
+    running this loop syncs on its own, so enable it in one process and set CATEGORY_SYNC_INTERVAL=0 elsewhere.
+    """
+    while True:
+        try:
+            async with session_scope() as db:
+                synced = await categories.sync_categories(taskmaster_client, db)
+            logger.info("Categories mirror synced", count=synced)
+        except Exception as e:
+            logger.error("Category sync failed", error=str(e))
+        await asyncio.sleep(settings.CATEGORY_SYNC_INTERVAL)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic
-    init_db()
-    logger.info("Database initialized and service started")
+    if settings.RUN_MIGRATIONS:
+        await run_migrations()
+        logger.info("Database initialized and service started")
+    else:
+        logger.info("Service started without running migrations")
+    start_cpu_pool()
+    sync_task = asyncio.create_task(_category_sync_loop()) if settings.CATEGORY_SYNC_INTERVAL > 0 else None
     yield
-    # Shutdown logic (optional)
+    # Shutdown logic
+    if sync_task is not None:
+        sync_task.cancel()
+        try:
+            await sync_task
+        except asyncio.CancelledError:
+            pass
+    shutdown_cpu_pool()
+    await taskmaster_client.aclose()
     logger.info("Shutting down service")
 
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 app = FastAPI(
     title="Taskmaster MCP Service",
@@ -334,69 +409,99 @@ async def handle_messages(request: Request):
 
 # --- Standard REST Endpoints for ChatGPT Actions ---
 
+@app.get("/tools", summary="List the available MCP tools and their input schemas")
+async def list_tools() -> Response:
+    return Response(content=_TOOL_LIST_BYTES, media_type="application/json")
+
 @app.get("/tools/get_categories", summary="Get all active categories from Taskmaster")
-async def get_categories():
+async def get_categories() -> List[CategoryBrief]:
     return await categories.get_categories(taskmaster_client)
 
 @app.get("/tools/get_category_tasks", summary="Fetch tasks for a specific category")
-async def get_category_tasks(category_id: int):
+async def get_category_tasks(category_id: int) -> List[Task]:
     return await tasks.get_category_tasks(category_id, taskmaster_client)
 
 @app.get("/tools/search_tasks", summary="Search for tasks by alias, provider name, or keyword across all categories")
-async def search_tasks(query: str):
+async def search_tasks(query: str) -> List[MatchedTask]:
     return await tasks.get_tasks_by_alias(query, taskmaster_client)
 
+@app.get("/tools/search_tasks/stream", summary="Stream search matches as NDJSON, one line per task, as each category is scanned")
+async def search_tasks_stream(query: str, time_window_days: int = 7) -> StreamingResponse:
+    async def ndjson():
+        async for hits in taskmaster_client.iter_search_tasks(query, time_window_days=time_window_days):
+            yield b"".join(orjson.dumps(item, default=_pyd_default) + b"\n" for item in hits)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 @app.get("/tools/get_provider_updates", summary="Get a summarized report for a specific medical provider alias")
-async def get_provider_updates(provider_alias: str):
-    return await tasks.get_provider_updates(provider_alias, taskmaster_client)
+async def get_provider_updates(provider_alias: str, detail_level: str = "short") -> str:
+    return await tasks.get_provider_updates(provider_alias, taskmaster_client, detail_level=detail_level)
 
 @app.get("/tools/get_blocked_tasks", summary="Fetch all blocked tasks across all categories for emergency review")
-async def get_blocked_tasks():
+async def get_blocked_tasks() -> List[MatchedTask]:
     return await tasks.get_all_blocked_tasks(taskmaster_client)
 
 @app.get("/tools/get_overdue_tasks", summary="Fetch all overdue tasks across all categories for deadline tracking")
-async def get_overdue_tasks():
+async def get_overdue_tasks() -> List[MatchedTask]:
     return await tasks.get_all_overdue_tasks(taskmaster_client)
 
+@app.get("/tools/get_executive_overview", summary="Fetch blocked and overdue tasks across all categories in one call")
+async def get_executive_overview(category_id: int = None) -> Dict[str, List[MatchedTask]]:
+    return await tasks.get_executive_overview(taskmaster_client, category_id)
+
+@app.get("/tools/get_dashboard", summary="Fetch blocked, overdue and optionally query-matching tasks in a single scan")
+async def get_dashboard(query: str = None) -> Dict[str, List[MatchedTask]]:
+    return await tasks.get_dashboard(taskmaster_client, query)
+
 @app.get("/tools/get_weekly_summary", summary="Generate category-level summary")
-async def get_weekly_summary(category_id: int):
+async def get_weekly_summary(category_id: int) -> str:
     return await newsletter.get_weekly_summary(category_id, taskmaster_client)
 
 @app.get("/tools/list_user_subscriptions", summary="Fetch categories subscribed by a user")
-async def list_user_subscriptions(user_email: str, db: Session = Depends(get_db)):
-    subs = await subscriptions.list_user_subscriptions(user_email, db)
-    # Complement with category names for better UX
-    all_cats = await taskmaster_client.get_all_categories()
-    result = []
-    for cat_id in subs:
-        cat_info = next((c for c in all_cats if c.id == cat_id), {"id": cat_id, "name": "Unknown"})
-        result.append(cat_info)
-    return result
+async def list_user_subscriptions(user_email: str, db: AsyncSession = Depends(get_db)) -> List[CategoryBrief]:
+    # Category names come from the synced categories mirror, joined in SQL
+    return await subscriptions.list_user_subscriptions(user_email, db)
 
 @app.get("/tools/preview_newsletter", summary="Preview user's weekly newsletter")
-async def preview_newsletter(user_email: str, db: Session = Depends(get_db)):
+async def preview_newsletter(user_email: str, db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
     return await newsletter.preview_newsletter(user_email, taskmaster_client, db)
 
+@app.get("/tools/preview_newsletter/stream", summary="Stream a user's newsletter preview, one NDJSON line per category")
+async def preview_newsletter_stream(user_email: str, db: AsyncSession = Depends(get_db)) -> StreamingResponse:
+    # Resolve subscriptions up front so the DB session isn't held while summaries stream out
+    subscribed = await subscriptions.list_user_subscriptions(user_email, db)
+
+    async def ndjson():
+        async for entry in newsletter.stream_newsletter_preview([cat.id for cat in subscribed], taskmaster_client):
+            yield orjson.dumps(entry) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 @app.post("/tools/subscribe_category", summary="Subscribe user to a category")
-async def subscribe_category(user_email: str, category_id: int, db: Session = Depends(get_db)):
+async def subscribe_category(user_email: str, category_id: int, db: AsyncSession = Depends(get_db)) -> Dict[str, str]:
     # Validate category_id against Taskmaster as requested in Security Model
-    all_cats = await taskmaster_client.get_all_categories()
-    if not any(c.id == category_id for c in all_cats):
+    if not await taskmaster_client.is_valid_category(category_id):
         raise HTTPException(status_code=400, detail="Invalid Category ID")
     
-    return await subscriptions.subscribe_category(user_email, category_id, db)
+    return await subscriptions.subscribe_category(user_email, category_id, db, taskmaster_client)
 
 @app.post("/tools/unsubscribe_category", summary="Unsubscribe user from a category")
-async def unsubscribe_category(user_email: str, category_id: int, db: Session = Depends(get_db)):
+async def unsubscribe_category(user_email: str, category_id: int, db: AsyncSession = Depends(get_db)) -> Dict[str, str]:
     return await subscriptions.unsubscribe_category(user_email, category_id, db)
 
+@app.post("/tools/cache_clear", summary="Invalidate cached Taskmaster data and summaries")
+async def cache_clear() -> Dict[str, str]:
+    taskmaster_client.clear_cache()
+    tasks.clear_summary_cache()
+    return {"status": "success", "message": "Caches cleared"}
+
 @app.get("/health")
-def health_check():
+def health_check() -> Dict[str, str]:
     return {"status": "healthy"}
 
 # --- Root Welcome Page ---
 @app.get("/")
-async def root():
+async def root() -> Dict[str, str]:
     return {
         "name": "Taskmaster MCP Service",
         "status": "online",
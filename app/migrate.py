@@ -0,0 +1,16 @@
+import asyncio
+from .connectors.db import engine, init_db
+
+async def run_migrations():
+    """Create any missing tables. Idempotent, so it is safe both as a pre-deploy job and on a single-process boot."""
+    await init_db()
+
+async def _main():
+    try:
+        await run_migrations()
+    finally:
+        await engine.dispose()
+
+if __name__ == "__main__":
+    # One-shot schema setup for multi-worker deployments: `python -m app.migrate`, then start workers with RUN_MIGRATIONS=0
+    asyncio.run(_main())
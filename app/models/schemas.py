@@ -1,6 +1,12 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from enum import IntEnum
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 from typing import List, Optional
 
+class StatusKind(IntEnum):
+    PENDING = 0
+    DONE = 1
+
 class Task(BaseModel):
     taskId: int = Field(alias="TaskId")
     taskSubject: str = Field(alias="SubjectLine")
@@ -11,8 +17,36 @@ class Task(BaseModel):
     daysOverdue: Optional[int] = Field(0, alias="DaysOverdue")
     importanceScore: float = 0.0
 
-    class Config:
-        populate_by_name = True
+    # Lower-cased search fields, computed once at parse time
+    _subject_lc: str = PrivateAttr(default="")
+    _assignee_lc: str = PrivateAttr(default="")
+    _status_kind: StatusKind = PrivateAttr(default=StatusKind.PENDING)
+    # Summarizer tokens of subject + comments, memoized on first use
+    _tokens: Optional[List[str]] = PrivateAttr(default=None)
+
+    # Upstream payloads carry many fields we don't model; ignore them rather than storing them
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+    @model_validator(mode="after")
+    def _precompute_search_fields(self):
+        self._subject_lc = self.taskSubject.lower()
+        self._assignee_lc = (self.assigneeName or "").lower()
+        self._status_kind = StatusKind.DONE if "Done" in self.taskStatus else StatusKind.PENDING
+        return self
+
+    @property
+    def statusKind(self) -> StatusKind:
+        return self._status_kind
+
+@dataclass(slots=True, frozen=True)
+class MatchedTask:
+    """
+    A task matched by a cross-category scan, serialized only at the response boundary.
+    One is created per match per scan, so it is a slotted dataclass rather than a model: no per-instance
+    __dict__ and no validation, while FastAPI and orjson still serialize it directly.
+    """
+    category: str
+    task: Task
 
 class CategoryData(BaseModel):
     categoryId: int
@@ -0,0 +1,59 @@
+import asyncio
+import functools
+import os
+import structlog
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, TypeVar
+from ..config import settings
+
+logger = structlog.get_logger()
+
+__all__ = ["start_cpu_pool", "shutdown_cpu_pool", "prewarm", "run_cpu"]
+
+T = TypeVar("T")
+
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+_cpu_workers = 0
+_warmed = False
+
+def start_cpu_pool():
+    """Create the summarization process pool when SUMMARY_EXECUTOR is "process"; threads need no setup."""
+    global _cpu_pool, _cpu_workers, _warmed
+    if settings.SUMMARY_EXECUTOR == "process" and _cpu_pool is None:
+        _cpu_workers = settings.SUMMARY_WORKERS or os.cpu_count()
+        _cpu_pool = ProcessPoolExecutor(max_workers=_cpu_workers)
+        _warmed = False
+        logger.info("Summarization process pool started", workers=_cpu_workers)
+
+def shutdown_cpu_pool():
+    global _cpu_pool
+    if _cpu_pool is not None:
+        _cpu_pool.shutdown(wait=False, cancel_futures=True)
+        _cpu_pool = None
+
+def _warm_worker():
+    # Runs inside a pool worker: pays the process start and the NumPy / summarizer imports
+    from .summarizer import tokenize
+    tokenize("warm up")
+
+async def prewarm():
+    """
+    Spin up the process pool's workers ahead of the first summary, e.g. while its tasks are still being fetched.
+    Only the first call does any work; with the thread executor there is nothing to warm.
+    """
+    global _warmed
+    if _cpu_pool is None or _warmed:
+        return
+    _warmed = True
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*[loop.run_in_executor(_cpu_pool, _warm_worker) for _ in range(_cpu_workers)])
+
+async def run_cpu(fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run CPU-bound work off the event loop: in the process pool if one is running, otherwise in a thread.
+    In the process pool, arguments are pickled, so in-place changes (e.g. memoized Task tokens) stay in the worker.
+    """
+    if _cpu_pool is None:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_cpu_pool, functools.partial(fn, *args, **kwargs))
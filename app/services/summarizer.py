@@ -1,65 +1,88 @@
-import math
+import heapq
 import re
-from typing import List
+from itertools import islice
+import numpy as np
+from typing import Iterable, List, Tuple
 from ..models.schemas import Task
 
+# Indexed by StatusKind
+_STATUS_ICONS = ("[PNDG]", "[DONE]")
+
+# Words of three or more characters; the length filter lives in the pattern itself
+_TOKEN_RE = re.compile(r'\w{3,}')
+
 def tokenize(text: str) -> List[str]:
     """Simple tokenizer that converts text to lower case and removes non-alphanumeric chars."""
-    if not text:
-        return []
-    tokens = re.findall(r'\w+', text.lower())
-    return [t for t in tokens if len(t) > 2]
+    return _TOKEN_RE.findall(text.lower()) if text else []
 
-def compute_tfidf(tasks: List[Task]):
+def _task_tokens(task: Task) -> List[str]:
+    """Tokens of a task's subject and comments, tokenized once per task and reused across summaries."""
+    if task._tokens is None:
+        task._tokens = tokenize(f"{task.taskSubject} {' '.join(task.followUpComments)}")
+    return task._tokens
+
+def compute_tfidf(tasks: List[Task]) -> List[float]:
     """
     Computes TF-IDF scores for tasks.
     Treats each task as a document.
     """
+    return compute_tfidf_groups([tasks])[0]
+
+def compute_tfidf_groups(task_groups: List[List[Task]]) -> List[List[float]]:
+    """
+    Computes TF-IDF scores for several independent task sets in one vectorized pass.
+    IDF stays per set, so each set scores exactly as compute_tfidf would score it alone.
+    Scores are returned per set, in task order; the (shared, cached) Task objects are left untouched.
+    """
+    tasks = [task for group in task_groups for task in group]
     if not tasks:
-        return
+        return [[] for _ in task_groups]
 
-    documents = []
-    for task in tasks:
-        text = f"{task.taskSubject} {' '.join(task.followUpComments)}"
-        documents.append(tokenize(text))
+    documents = [_task_tokens(task) for task in tasks]
 
     num_docs = len(documents)
-    if num_docs == 0:
-        return
 
-    # Count Document Frequency (DF)
-    all_words = set(word for doc in documents for word in doc)
-    df = {}
-    for word in all_words:
-        count = sum(1 for doc in documents if word in doc)
-        df[word] = count
+    # Map every token to a vocabulary id; doc_idx[i] is the document that token i came from
+    vocab = {}
+    term_ids = np.fromiter((vocab.setdefault(word, len(vocab)) for doc in documents for word in doc), dtype=np.int64)
+    lengths = np.fromiter((len(doc) for doc in documents), dtype=np.int64, count=num_docs)
+    if term_ids.size == 0:
+        return [[0.0] * len(group) for group in task_groups]
+    doc_idx = np.repeat(np.arange(num_docs), lengths)
+    group_sizes = np.array([len(group) for group in task_groups], dtype=np.int64)
+    doc_group = np.repeat(np.arange(len(task_groups)), group_sizes)
 
-    # Compute TF-IDF for each task
-    for i, task in enumerate(tasks):
-        doc = documents[i]
-        if not doc:
-            task.importanceScore = 0.0
-            continue
-            
-        tf = {}
-        for word in doc:
-            tf[word] = tf.get(word, 0) + 1
-            
-        score = 0.0
-        for word, count in tf.items():
-            idf_val = math.log(num_docs / df[word]) if df[word] > 0 else 0
-            score += count * idf_val
-        
-        task.importanceScore = round(score / len(doc), 4) if doc else 0.0
+    # Document Frequency (DF) per (group, term) in a single pass over the tokens: each (document, term)
+    # pair is counted once, so there is no per-word rescan of the documents
+    vocab_size = len(vocab)
+    doc_terms = np.unique(doc_idx * vocab_size + term_ids)
+    group_terms, df = np.unique(doc_group[doc_terms // vocab_size] * vocab_size + doc_terms % vocab_size, return_counts=True)
+    token_group = doc_group[doc_idx]
+    token_df = df[np.searchsorted(group_terms, token_group * vocab_size + term_ids)]
+    idf = np.log(group_sizes[token_group] / token_df)
 
-def get_summarized_report(category_name: str, tasks: List[Task], detail_level: str = "short", time_window_label: str = "Last 7 Days") -> str:
-    """Generates a ranked summary with configurable detail level."""
-    compute_tfidf(tasks)
-    # Sort by importance
-    ranked_tasks = sorted(tasks, key=lambda x: x.importanceScore, reverse=True)
-    
-    # Take top 5 tasks for summary
-    top_tasks = ranked_tasks[:5]
+    # sum(tf * idf) over a document's terms is the sum of idf over its tokens
+    scores = np.bincount(doc_idx, weights=idf, minlength=num_docs)
+    scores = np.divide(scores, lengths, out=np.zeros(num_docs), where=lengths > 0)
+    rounded = [round(float(score), 4) for score in scores]
+    bounds = np.cumsum(group_sizes).tolist()
+    return [rounded[end - len(group):end] for group, end in zip(task_groups, bounds)]
+
+def get_summarized_report(category_name: str, tasks: Iterable[Task], detail_level: str = "short", time_window_label: str = "Last 7 Days", top_k: int = 5) -> str:
+    """Generates a ranked summary of the top_k tasks with configurable detail level. Accepts any iterable of tasks."""
+    # Scoring and ranking both walk the tasks, so a generator is materialized exactly once; lists pass through
+    tasks = tasks if isinstance(tasks, list) else list(tasks)
+    return _render_report(category_name, tasks, compute_tfidf(tasks), detail_level, time_window_label, top_k)
+
+def get_summarized_reports(reports: List[Tuple[str, List[Task]]], detail_level: str = "short", time_window_label: str = "Last 7 Days", top_k: int = 5) -> List[str]:
+    """Batch form of get_summarized_report: scores every (category_name, tasks) pair in a single TF-IDF pass."""
+    all_scores = compute_tfidf_groups([tasks for _, tasks in reports])
+    return [_render_report(name, tasks, scores, detail_level, time_window_label, top_k)
+            for (name, tasks), scores in zip(reports, all_scores)]
+
+def _render_report(category_name: str, tasks: List[Task], scores: List[float], detail_level: str, time_window_label: str, top_k: int = 5) -> str:
+    # Take the top_k tasks by importance; a bounded heap instead of sorting the whole list
+    top_tasks = [tasks[i] for i in heapq.nlargest(top_k, range(len(tasks)), key=scores.__getitem__)]
     
     summary_lines = [f"### {category_name} - Summary ({time_window_label})"]
     if not top_tasks:
@@ -72,22 +95,22 @@ def get_summarized_report(category_name: str, tasks: List[Task], detail_level: s
 
 def get_single_task_summary(task: Task, detail_level: str = "short") -> str:
     """Generates a summary for a single task."""
-    status_icon = "[DONE]" if "Done" in task.taskStatus else "[PNDG]"
-    summary = f"- {status_icon} **{task.taskSubject}** (ID: {task.taskId}, Status: {task.taskStatus})"
+    status_icon = _STATUS_ICONS[task.statusKind]
+    parts = [f"- {status_icon} **{task.taskSubject}** (ID: {task.taskId}, Status: {task.taskStatus})"]
     
     if not task.followUpComments:
-        return summary
+        return parts[0]
         
     if detail_level == "short":
         # Just the latest comment, truncated
         latest = task.followUpComments[0][:150] + "..." if len(task.followUpComments[0]) > 150 else task.followUpComments[0]
-        summary += f"\n  *Latest update:* {latest}"
+        parts.append(f"  *Latest update:* {latest}")
     else:
         # Detailed: combine all comments or first few in detail
-        summary += "\n  *Recent Updates:*"
-        for i, comment in enumerate(task.followUpComments[:5]): # Show up to 5 comments in detail
-            summary += f"\n    {i+1}. {comment}"
+        parts.append("  *Recent Updates:*")
+        for i, comment in enumerate(islice(task.followUpComments, 5), 1): # Show up to 5 comments in detail
+            parts.append(f"    {i}. {comment}")
         if len(task.followUpComments) > 5:
-            summary += f"\n    ... and {len(task.followUpComments) - 5} more updates."
+            parts.append(f"    ... and {len(task.followUpComments) - 5} more updates.")
             
-    return summary
+    return "\n".join(parts)
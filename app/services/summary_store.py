@@ -0,0 +1,59 @@
+import hashlib
+import orjson
+import structlog
+from typing import Callable, Iterable, List, Optional, Tuple
+from ..config import settings
+from ..models.schemas import Task
+
+logger = structlog.get_logger()
+
+__all__ = ["enabled", "content_key", "get_summary", "set_summary", "render_cached"]
+
+_store = None
+_opened = False
+
+def _get_store():
+    """The on-disk summary cache, opened on first use; None when SUMMARY_CACHE_DIR is unset."""
+    global _store, _opened
+    if not _opened:
+        _opened = True
+        if settings.SUMMARY_CACHE_DIR:
+            import diskcache
+            _store = diskcache.Cache(settings.SUMMARY_CACHE_DIR)
+            logger.info("Persistent summary cache enabled", directory=settings.SUMMARY_CACHE_DIR)
+    return _store
+
+def enabled() -> bool:
+    return _get_store() is not None
+
+def content_key(tasks: Iterable[Task], *parts: str) -> str:
+    """
+    Hash of everything a rendered summary depends on (the tasks plus rendering parameters), so entries
+    survive restarts while any change to a task's subject, status or comments is a miss, never a stale hit.
+    """
+    payload = orjson.dumps([
+        parts,
+        [(t.taskId, t.taskSubject, t.taskStatus, t.followUpComments) for t in tasks]
+    ])
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+def get_summary(key: Optional[str]) -> Optional[str]:
+    store = _get_store()
+    return store.get(key) if store is not None and key else None
+
+def set_summary(key: Optional[str], summary: str):
+    store = _get_store()
+    if store is not None and key:
+        store.set(key, summary, expire=settings.SUMMARY_CACHE_TTL)
+
+def render_cached(key_parts: Tuple[str, ...], tasks: List[Task], render: Callable[..., str], *args, **kwargs) -> str:
+    """
+    `render(*args, **kwargs)`, served from the on-disk cache when configured. Hashing the tasks and the SQLite
+    lookup are blocking, so this runs inside run_cpu along with the rendering rather than on the event loop.
+    """
+    key = content_key(tasks, *key_parts) if enabled() else None
+    summary = get_summary(key)
+    if summary is None:
+        summary = render(*args, **kwargs)
+        set_summary(key, summary)
+    return summary
@@ -1,4 +1,26 @@
-from ..connectors.taskmaster_client import TaskmasterClient
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..connectors.taskmaster_client import TaskmasterClient, get_client
+from ..connectors.db import Category, dialect_insert
+from ..models.schemas import CategoryBrief
 
-async def get_categories(client: TaskmasterClient):
+async def get_categories(client: TaskmasterClient = None):
+    client = client or get_client()
     return await client.get_all_categories()
+
+async def sync_categories(client: TaskmasterClient, db: AsyncSession) -> int:
+    """Upsert the live Taskmaster categories into the local `categories` mirror. Returns the number synced."""
+    categories = await client.get_all_categories()
+    if not categories:
+        return 0
+
+    await upsert_categories(categories, db)
+    await db.commit()
+    return len(categories)
+
+async def upsert_categories(categories: List[CategoryBrief], db: AsyncSession):
+    """Insert or rename rows in the `categories` mirror, in the caller's transaction."""
+    insert = dialect_insert(db)
+    stmt = insert(Category).values([{"id": c.id, "name": c.name} for c in categories])
+    stmt = stmt.on_conflict_do_update(index_elements=[Category.id], set_={"name": stmt.excluded.name})
+    await db.execute(stmt)
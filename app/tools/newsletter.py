@@ -1,42 +1,91 @@
-from ..connectors.taskmaster_client import TaskmasterClient
-from ..services.summarizer import get_summarized_report
+import asyncio
+import structlog
+from typing import Any, AsyncIterator, Dict, List
+from ..connectors.taskmaster_client import TaskmasterClient, get_client
+from ..services.summarizer import get_summarized_report, get_summarized_reports
+from ..services.executor import run_cpu
 from .subscriptions import list_user_subscriptions
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-async def get_weekly_summary(category_id: int, client: TaskmasterClient):
+logger = structlog.get_logger()
+
+async def get_weekly_summary(category_id: int, client: TaskmasterClient = None):
+    client = client or get_client()
     # Fetch category info to get name
-    categories = await client.get_all_categories()
-    category = next((c for c in categories if c.id == category_id), None)
+    categories = await client.get_categories_map()
+    category = categories.get(category_id)
     category_name = category.name if category else f"Category {category_id}"
     
     tasks = await client.get_category_tasks(category_id)
-    return get_summarized_report(category_name, tasks)
+    return await run_cpu(get_summarized_report, category_name, tasks)
 
-async def preview_newsletter(user_email: str, client: TaskmasterClient, db: Session):
+async def preview_newsletter(user_email: str, client: TaskmasterClient, db: AsyncSession):
     # 1. Get subscriptions
-    category_ids = await list_user_subscriptions(user_email, db)
-    if not category_ids:
+    subscribed = await list_user_subscriptions(user_email, db)
+    if not subscribed:
         return {"message": "User has no subscriptions"}
+    category_ids = [cat.id for cat in subscribed]
     
-    # 2. Fetch categories info
-    all_categories = await client.get_all_categories()
+    # 2. Fetch categories info and every subscribed category's tasks concurrently
+    semaphore = asyncio.Semaphore(8)
+
+    async def fetch_tasks(cat_id):
+        async with semaphore:
+            return await client.get_category_tasks(cat_id)
+
+    all_categories, task_lists = await asyncio.gather(
+        client.get_categories_map(),
+        asyncio.gather(*[fetch_tasks(cat_id) for cat_id in category_ids], return_exceptions=True)
+    )
     
-    # 3. For each subscription, fetch tasks and summarize
-    preview = []
-    for cat_id in category_ids:
-        cat_info = next((c for c in all_categories if c.id == cat_id), None)
+    # 3. Summarize every subscription in one batch, off the event loop
+    reports = []
+    for cat_id, tasks in zip(category_ids, task_lists):
+        if isinstance(tasks, Exception):
+            logger.error("Failed to fetch newsletter tasks", category_id=cat_id, error=str(tasks))
+            tasks = []
+        cat_info = all_categories.get(cat_id)
         cat_name = cat_info.name if cat_info else f"Category {cat_id}"
-        
-        tasks = await client.get_category_tasks(cat_id)
-        summary = get_summarized_report(cat_name, tasks)
-        
-        preview.append({
+        reports.append((cat_name, tasks))
+    summaries = await run_cpu(get_summarized_reports, reports)
+    
+    preview = [
+        {
             "category_id": cat_id,
             "category_name": cat_name,
             "summary": summary
-        })
+        }
+        for cat_id, (cat_name, _), summary in zip(category_ids, reports, summaries)
+    ]
     
     return {
         "user_email": user_email,
         "newsletter_preview": preview
     }
+
+async def stream_newsletter_preview(category_ids: List[int], client: TaskmasterClient = None) -> AsyncIterator[Dict[str, Any]]:
+    """Yield one preview entry per subscribed category as soon as its tasks are fetched and summarized."""
+    client = client or get_client()
+    all_categories = await client.get_categories_map()
+    semaphore = asyncio.Semaphore(8)
+
+    async def build(cat_id):
+        cat_info = all_categories.get(cat_id)
+        cat_name = cat_info.name if cat_info else f"Category {cat_id}"
+        async with semaphore:
+            try:
+                tasks = await client.get_category_tasks(cat_id)
+            except Exception as e:
+                logger.error("Failed to fetch newsletter tasks", category_id=cat_id, error=str(e))
+                tasks = []
+        summary = await run_cpu(get_summarized_report, cat_name, tasks)
+        return {"category_id": cat_id, "category_name": cat_name, "summary": summary}
+
+    pending = [asyncio.create_task(build(cat_id)) for cat_id in category_ids]
+    try:
+        for next_done in asyncio.as_completed(pending):
+            yield await next_done
+    finally:
+        # The consumer may stop early (e.g. client disconnect); don't leave summaries running
+        for task in pending:
+            task.cancel()
@@ -1,46 +1,76 @@
-from sqlalchemy.orm import Session
-from ..connectors.db import User, user_category_subscriptions
-from sqlalchemy import select, insert, delete
+from typing import List, Optional
+from cachetools import LRUCache
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..connectors.db import User, Category, user_category_subscriptions, dialect_insert
+from ..connectors.taskmaster_client import TaskmasterClient, get_client
+from ..models.schemas import CategoryBrief
+from .categories import upsert_categories
+from sqlalchemy import select, delete, func
 
-async def list_user_subscriptions(user_email: str, db: Session):
-    user = db.query(User).filter(User.email == user_email).first()
-    if not user:
-        return []
-    
-    # Query the mapping table
-    query = select(user_category_subscriptions.c.category_id).where(user_category_subscriptions.c.user_id == user.id)
-    result = db.execute(query).scalars().all()
-    return list(result)
+# email -> users.id; users are never deleted, so an entry stays valid once cached
+_user_id_cache = LRUCache(maxsize=10_000)
 
-async def subscribe_category(user_email: str, category_id: int, db: Session):
-    user = db.query(User).filter(User.email == user_email).first()
-    if not user:
-        user = User(email=user_email)
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-    
-    # Check if already subscribed
-    query = select(user_category_subscriptions).where(
-        user_category_subscriptions.c.user_id == user.id,
-        user_category_subscriptions.c.category_id == category_id
+async def _get_user_id(user_email: str, db: AsyncSession) -> Optional[int]:
+    user_id = _user_id_cache.get(user_email)
+    if user_id is None:
+        user_id = (await db.execute(select(User.id).where(User.email == user_email))).scalar()
+        if user_id is not None:
+            _user_id_cache[user_email] = user_id
+    return user_id
+
+async def _get_or_create_user_id(user_email: str, db: AsyncSession) -> int:
+    user_id = _user_id_cache.get(user_email)
+    if user_id is None:
+        # Upsert so lookup and creation are a single round-trip; the no-op update makes RETURNING yield existing rows too
+        insert_user = dialect_insert(db)(User).values(email=user_email)
+        stmt = insert_user.on_conflict_do_update(
+            index_elements=[User.email], set_={"email": insert_user.excluded.email}
+        ).returning(User.id)
+        user_id = (await db.execute(stmt)).scalar_one()
+    return user_id
+
+async def list_user_subscriptions(user_email: str, db: AsyncSession) -> List[CategoryBrief]:
+    # One round-trip: resolve the user and join subscriptions against the mirrored categories.
+    # Outer join so subscriptions to categories not synced yet still show up, as "Unknown".
+    query = (
+        select(user_category_subscriptions.c.category_id, func.coalesce(Category.name, "Unknown"))
+        .join(User, User.id == user_category_subscriptions.c.user_id)
+        .outerjoin(Category, Category.id == user_category_subscriptions.c.category_id)
+        .where(User.email == user_email)
+        .order_by(user_category_subscriptions.c.id)
     )
-    existing = db.execute(query).first()
-    if not existing:
-        stmt = insert(user_category_subscriptions).values(user_id=user.id, category_id=category_id)
-        db.execute(stmt)
-        db.commit()
+    rows = (await db.execute(query)).all()
+    return [CategoryBrief(id=cat_id, name=name) for cat_id, name in rows]
+
+async def subscribe_category(user_email: str, category_id: int, db: AsyncSession, client: TaskmasterClient = None):
+    client = client or get_client()
+    # Mirror the category now rather than waiting for the next sync, so listings show its name straight away.
+    # Resolved before the write transaction starts, so a category-list fetch never runs while row locks are held.
+    category = (await client.get_categories_map()).get(category_id)
+
+    user_id = await _get_or_create_user_id(user_email, db)
+    if category is not None:
+        await upsert_categories([category], db)
+    
+    # Already subscribed is a no-op; uix_user_category makes this one statement instead of check-then-insert
+    stmt = dialect_insert(db)(user_category_subscriptions).values(
+        user_id=user_id, category_id=category_id
+    ).on_conflict_do_nothing(index_elements=["user_id", "category_id"])
+    await db.execute(stmt)
+    await db.commit()
+    # Cache only once committed, so a rolled-back user row is never remembered
+    _user_id_cache[user_email] = user_id
     return {"status": "success", "message": f"Subscribed {user_email} to category {category_id}"}
 
-async def unsubscribe_category(user_email: str, category_id: int, db: Session):
-    user = db.query(User).filter(User.email == user_email).first()
-    if not user:
+async def unsubscribe_category(user_email: str, category_id: int, db: AsyncSession):
+    user_id = await _get_user_id(user_email, db)
+    if user_id is None:
         return {"status": "error", "message": "User not found"}
     
     stmt = delete(user_category_subscriptions).where(
-        user_category_subscriptions.c.user_id == user.id,
+        user_category_subscriptions.c.user_id == user_id,
         user_category_subscriptions.c.category_id == category_id
     )
-    db.execute(stmt)
-    db.commit()
+    await db.execute(stmt)
+    await db.commit()
     return {"status": "success", "message": f"Unsubscribed {user_email} from category {category_id}"}
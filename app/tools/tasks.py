@@ -1,43 +1,153 @@
-from ..connectors.taskmaster_client import TaskmasterClient
-from ..services.summarizer import get_summarized_report
+import asyncio
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List
+from cachetools import TTLCache
+from ..connectors.taskmaster_client import TaskmasterClient, get_client, is_blocked, is_overdue
+from ..connectors.dataloader import TaskLoader
 from ..models.schemas import Task
+from ..services.summarizer import get_single_task_summary, get_summarized_report
+from ..services.executor import prewarm, run_cpu
+from ..services import summary_store
 
-async def get_category_tasks(category_id: int, client: TaskmasterClient, time_window_days: int = 7):
+# Rendered provider and task summaries keyed on (kind, client base_url, alias or task id, detail_level, window);
+# a hit skips the search and the summarizer entirely
+_summary_cache = TTLCache(maxsize=256, ttl=60)
+# "Not found" answers keyed on (kind, client base_url, alias or task id, window), kept briefly to absorb agent retry loops
+# without hiding newly created tasks for long
+_not_found_cache = TTLCache(maxsize=1024, ttl=30)
+
+def clear_summary_cache():
+    _summary_cache.clear()
+    _not_found_cache.clear()
+
+# One loader per client, so concurrent task lookups against the same client share a batch. A plain dict:
+# clients are long-lived (normally the one get_client() singleton), and each loader references its client anyway
+_task_loaders: Dict[TaskmasterClient, TaskLoader] = {}
+
+def _get_task_loader(client: TaskmasterClient) -> TaskLoader:
+    loader = _task_loaders.get(client)
+    if loader is None:
+        loader = _task_loaders[client] = TaskLoader(client)
+    return loader
+
+async def get_category_tasks(category_id: int, client: TaskmasterClient = None, time_window_days: int = 7):
+    client = client or get_client()
     return await client.get_category_tasks(category_id, time_window_days=time_window_days)
 
-async def get_tasks_by_alias(alias: str, client: TaskmasterClient, time_window_days: int = 7):
+async def get_tasks_by_alias(alias: str, client: TaskmasterClient = None, time_window_days: int = 7):
     """Search for tasks by alias / provider name."""
+    client = client or get_client()
     return await client.search_tasks(alias, time_window_days=time_window_days)
 
-async def get_all_blocked_tasks(client: TaskmasterClient):
+async def get_all_blocked_tasks(client: TaskmasterClient = None):
     """Fetch all blocked tasks for an executive overview."""
+    client = client or get_client()
     return await client.get_all_blocked_tasks()
 
-async def get_all_overdue_tasks(client: TaskmasterClient):
+async def get_all_overdue_tasks(client: TaskmasterClient = None):
     """Fetch all overdue tasks for an executive overview."""
+    client = client or get_client()
     return await client.get_all_overdue_tasks()
 
-async def get_provider_updates(provider_alias: str, client: TaskmasterClient, detail_level: str = "short", time_window_days: int = 7):
+async def get_dashboard(client: TaskmasterClient = None, query: str = None):
+    """Fetch blocked, overdue and optionally query-matching tasks in one pass."""
+    client = client or get_client()
+    return await client.get_dashboard(query)
+
+async def get_executive_overview(client: TaskmasterClient = None, category_id: int = None):
+    """Blocked and overdue tasks together (plus one category's tasks if asked), for dashboards that want both."""
+    client = client or get_client()
+    # One shared scan rather than separate blocked / overdue / category fetches
+    return await client.get_overview_bundle(category_id)
+
+# Status buckets for the brief digest; a task can land in more than one
+_DIGEST_BUCKETS = (("blocked", is_blocked), ("overdue", is_overdue))
+
+def _brief_digest(provider_alias: str, tasks, time_window_label: str) -> str:
+    """Deterministic counts-and-titles digest for detail_level="brief"; no ranking or summarization."""
+    # Every bucket counted in a single pass over the tasks
+    counts = Counter(name for t in tasks for name, predicate in _DIGEST_BUCKETS if predicate(t))
+    top = "; ".join(t.taskSubject for t in tasks[:5])
+    return (
+        f"Provider {provider_alias}: {len(tasks)} tasks ({counts['blocked']} blocked, {counts['overdue']} overdue) "
+        f"in {time_window_label.lower()}. Top: {top}"
+    )
+
+@lru_cache(maxsize=64)
+def _window_label(time_window_days: int) -> str:
+    return f"Last {time_window_days} Days" if time_window_days else "All Time"
+
+async def get_provider_updates(provider_alias: str, client: TaskmasterClient = None, detail_level: str = "short", time_window_days: int = 7):
     """Fetch and summarize updates for a specific medical provider alias."""
-    search_results = await client.search_tasks(provider_alias, time_window_days=time_window_days)
+    client = client or get_client()
+    cache_key = ("provider", client.base_url, provider_alias, detail_level, time_window_days)
+    not_found_key = ("provider", client.base_url, provider_alias, time_window_days)
+    cached = _summary_cache.get(cache_key) or _not_found_cache.get(not_found_key)
+    if cached is not None:
+        return cached
+
+    if detail_level == "brief":
+        # Fast path: counts and titles only, so there is nothing to warm or summarize
+        search_results = await client.search_tasks(provider_alias, time_window_days=time_window_days)
+    else:
+        # Warm the summarization workers while the search is in flight
+        search_results, _ = await asyncio.gather(
+            client.search_tasks(provider_alias, time_window_days=time_window_days),
+            prewarm()
+        )
     if not search_results:
-        return f"No tasks or updates found for provider '{provider_alias}'."
+        not_found = f"No tasks or updates found for provider '{provider_alias}'."
+        _not_found_cache[not_found_key] = not_found
+        return not_found
     
     # Extract tasks for summarization
-    tasks = []
-    for item in search_results:
-        task_data = item["task"]
-        t = Task(**task_data)
-        tasks.append(t)
+    tasks = [item.task for item in search_results]
     
-    label = f"Last {time_window_days} Days" if time_window_days else "All Time"
-    return get_summarized_report(f"Provider: {provider_alias}", tasks, detail_level=detail_level, time_window_label=label)
+    label = _window_label(time_window_days)
+    if detail_level == "brief":
+        summary = _brief_digest(provider_alias, tasks, label)
+        _summary_cache[cache_key] = summary
+        return summary
+    header = f"Provider: {provider_alias}"
+    summary = await run_cpu(
+        summary_store.render_cached, ("provider", header, detail_level, label), tasks,
+        get_summarized_report, header, tasks, detail_level=detail_level, time_window_label=label
+    )
+    _summary_cache[cache_key] = summary
+    return summary
 
-async def get_task_summary(task_id: int, client: TaskmasterClient, detail_level: str = "short", time_window_days: int = None):
+async def get_task_summary(task_id: int, client: TaskmasterClient = None, detail_level: str = "short", time_window_days: int = None):
     """Fetch and summarize a specific task by its ID."""
-    task = await client.get_task_by_id(task_id, time_window_days=time_window_days)
+    client = client or get_client()
+    cache_key = ("task", client.base_url, task_id, detail_level, time_window_days)
+    not_found_key = ("task", client.base_url, task_id, time_window_days)
+    cached = _summary_cache.get(cache_key) or _not_found_cache.get(not_found_key)
+    if cached is not None:
+        return cached
+
+    task = await _get_task_loader(client).load(task_id, time_window_days=time_window_days)
     if not task:
-        return f"Task ID {task_id} not found."
+        not_found = f"Task ID {task_id} not found."
+        _not_found_cache[not_found_key] = not_found
+        return not_found
     
-    from ..services.summarizer import get_single_task_summary
-    return get_single_task_summary(task, detail_level=detail_level)
+    summary = await run_cpu(
+        summary_store.render_cached, ("task", detail_level), [task],
+        get_single_task_summary, task, detail_level=detail_level
+    )
+    _summary_cache[cache_key] = summary
+    return summary
+
+def _render_task_summaries(task_ids: List[int], found: Dict[int, Task], detail_level: str) -> Dict[int, str]:
+    return {
+        task_id: get_single_task_summary(found[task_id], detail_level=detail_level) if task_id in found else f"Task ID {task_id} not found."
+        for task_id in task_ids
+    }
+
+async def get_task_summaries(task_ids: List[int], client: TaskmasterClient = None, detail_level: str = "short", time_window_days: int = None) -> Dict[int, str]:
+    """Summarize several tasks by ID, fetched together in a single scan instead of one lookup per task."""
+    client = client or get_client()
+    found = await client.get_tasks_by_ids(task_ids, time_window_days=time_window_days)
+    # Rendered as one batch off the event loop, like the category reports
+    return await run_cpu(_render_task_summaries, task_ids, found, detail_level)